@@ -396,12 +396,11 @@ def natural_gradient_cross_entropy(model, inputs, targets, kernel, damping=1e-5)
                 mat[i * c: (i+1) * c, j * c: (j+1) * c] = block
     mat.div_(n)
     mat = _add_value_to_diagonal(mat, damping)
-    inv = torch.inverse(mat)
 
     model.zero_grad()
     loss = F.cross_entropy(outputs, targets)
     grads = torch.autograd.grad(loss, outputs, retain_graph=True)[0].flatten()  # nc x 1
-    v = torch.matmul(inv, grads).reshape(n, -1)  # n x c
+    v = torch.linalg.solve(mat, grads).reshape(n, -1)  # n x c
 
     # compute natural-gradient by auto-differentiation
     torch.autograd.backward(outputs, grad_tensors=v)
@@ -769,16 +768,12 @@ def _cholesky_solve(A, b, eps=1e-8):
 
 
 def _add_value_to_diagonal(X, value):
-    if X.ndim == 3:
-        return torch.stack([_add_value_to_diagonal(X[i], value) for i in range(X.shape[0])])
-    else:
-        if X.ndim != 2:
-            raise ValueError(f'X.ndim has to be 2. Got {X.ndim}.')
-
-    indices = torch.tensor([[i, i] for i in range(X.shape[0])], device=X.device).long()
+    if X.ndim not in [2, 3]:
+        raise ValueError(f'X.ndim has to be 2 or 3. Got {X.ndim}.')
 
-    values = X.new_ones(X.shape[0]).mul(value)
-    return X.index_put(tuple(indices.t()), values, accumulate=True)
+    X = X.clone()
+    X.diagonal(dim1=-2, dim2=-1).add_(value)
+    return X
 
 
 def _zero_kernel(model, n_data1, n_data2):
@@ -43,7 +43,7 @@ class BiasExt(Operation):
 
     @staticmethod
     def cov_kron_A(module, in_data):
-        return torch.ones((1, 1), device=in_data.device)
+        return in_data.new_ones((1, 1))
 
     @staticmethod
     def cov_kron_B(module, out_grads):
@@ -45,8 +45,8 @@ class Conv2d(Operation):
     def batch_grads_weight(
         module: nn.Module, in_data: torch.Tensor, out_grads: torch.Tensor
     ):
-        grads = torch.bmm(
-            out_grads, in_data.transpose(2, 1)
+        grads = torch.einsum(
+            'ncs,nfs->ncf', out_grads, in_data
         )  # n x c_out x (c_in)(kernel_size)
         return grads.view(
             -1, *module.weight.size()
@@ -63,9 +63,9 @@ class Conv2d(Operation):
 
         # select a calculation method that consumes less memory
         if out_size * (c_out + c_in * kh * kw) < c_out * c_in * kh * kw:
-            in_in = torch.square(in_data).transpose(0, 1).flatten(start_dim=1)  # (c_in)(kernel_size) x n(out_size)
-            grad_grad = torch.square(out_grads).transpose(0, 1).flatten(start_dim=1)  # c_out x n(out_size)
-            rst = torch.matmul(grad_grad, in_in.T)  # c_out x (c_in)(kernel_size)
+            in_in = torch.square(in_data)  # n x (c_in)(kernel_size) x out_size
+            grad_grad = torch.square(out_grads)  # n x c_out x out_size
+            rst = torch.einsum('ncs,nfs->cf', grad_grad, in_in)  # c_out x (c_in)(kernel_size)
             return rst.view_as(module.weight)  # c_out x c_in x k_h x k_w
         else:
             # n x c_out x c_in x k_h x k_w
@@ -75,7 +75,7 @@ class Conv2d(Operation):
     @staticmethod
     def cov_diag_bias(module, out_grads):
         grads = out_grads.sum(axis=2)  # n x c_out
-        return grads.mul(grads).sum(axis=0)  # c_out x 1
+        return torch.einsum('nc,nc->c', grads, grads)  # c_out x 1
 
     @staticmethod
     def cov_kron_A(module, in_data):
@@ -85,7 +85,7 @@ class Conv2d(Operation):
         )  # (c_in)(kernel_size) x n(out_size)
         return torch.matmul(
             m, m.T
-        ).div(out_size)  # (c_in)(kernel_size) x (c_in)(kernel_size)
+        ).div_(out_size)  # (c_in)(kernel_size) x (c_in)(kernel_size)
 
     @classmethod
     def cov_swift_kron_A(cls, module, in_data):
@@ -152,28 +152,21 @@ class Conv2d(Operation):
 
     @staticmethod
     def cov_unit_wise(module, in_data, out_grads):
-        m = torch.bmm(out_grads, in_data.transpose(1, 2))  # n x c_out x cin_ks
-        m = m.permute(1, 2, 0)  # c_out x cin_ks x n
-        return torch.matmul(m, m.transpose(1, 2))  # c_out x cin_ks x cin_ks
+        m = torch.einsum('ncs,nfs->ncf', out_grads, in_data)  # n x c_out x cin_ks
+        return torch.einsum('ncf,ncg->cfg', m, m)  # c_out x cin_ks x cin_ks
 
     @staticmethod
     def gram_A(module, in_data1, in_data2=None):
-        # n x (c_in)(kernel_size)(out_size)
-        m1 = in_data1.flatten(start_dim=1)
         if in_data2 is None:
-            return torch.matmul(m1, m1.T)  # n x n
-        m2 = in_data2.flatten(start_dim=1)
-        return torch.matmul(m1, m2.T)  # n x n
+            in_data2 = in_data1
+        return torch.einsum('nfs,mfs->nm', in_data1, in_data2)  # n x n
 
     @staticmethod
     def gram_B(module, out_grads1, out_grads2=None):
         out_size = out_grads1.shape[-1]
-        # n x (c_out)(out_size)
-        m1 = out_grads1.flatten(start_dim=1)
         if out_grads2 is None:
-            return torch.matmul(m1, m1.T).div(out_size)  # n x n
-        m2 = out_grads2.flatten(start_dim=1)
-        return torch.matmul(m1, m2.T).div(out_size)  # n x n
+            out_grads2 = out_grads1
+        return torch.einsum('ncs,mcs->nm', out_grads1, out_grads2).div_(out_size)  # n x n
 
     @staticmethod
     def in_data_mean(module, in_data):
@@ -26,23 +26,22 @@ class ScaleExt(Operation):
     """
     @staticmethod
     def batch_grads_weight(module, in_data, out_grads):
-        N = out_grads.size(0)
-        return (out_grads * in_data).view(N, -1).sum(dim=1).unsqueeze(-1)
+        grads = torch.einsum('nf,nf->n', out_grads.flatten(start_dim=1), in_data.flatten(start_dim=1))
+        return grads.unsqueeze(-1)  # n x 1
 
     @staticmethod
     def cov_diag_weight(module, in_data, out_grads):
-        N = out_grads.size(0)
-        return (out_grads * in_data).view(N, -1).sum(dim=1).square().sum()
+        grads = torch.einsum('nf,nf->n', out_grads.flatten(start_dim=1), in_data.flatten(start_dim=1))
+        return torch.dot(grads, grads)
 
     @staticmethod
     def cov_kron_A(module, in_data):
         N = in_data.size(0)
         setattr(module, 'n_in_data', in_data.reshape(N, -1))
-        return torch.ones(1, 1, device=in_data.device) 
+        return in_data.new_ones((1, 1))
 
     @staticmethod
     def cov_kron_B(module, out_grads):
-        N = out_grads.size(0)
         in_data = module.n_in_data
-        cov = (in_data * out_grads.view(N, -1)).sum(dim=1).square().sum()
-        return cov.reshape(1, 1)
+        grads = torch.einsum('nf,nf->n', in_data, out_grads.flatten(start_dim=1))  # n
+        return torch.dot(grads, grads).view(1, 1)
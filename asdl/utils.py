@@ -13,7 +13,7 @@ _REQUIRES_GRAD_ATTR = '_original_requires_grad'
 __all__ = [
     'original_requires_grad', 'record_original_requires_grad',
     'restore_original_requires_grad', 'skip_param_grad', 'im2col_2d',
-    'im2col_2d_slow', 'cholesky_inv', 'cholesky_solve', 'smw_inv',
+    'im2col_2d_slow', 'cholesky_inv', 'cholesky_solve', 'kron_eig_inverse', 'smw_inv',
     'PseudoBatchLoaderGenerator', 'nvtx_range', 'has_reduction'
 ]
 
@@ -37,15 +37,19 @@ def restore_original_requires_grad(param):
 
 @contextmanager
 def skip_param_grad(model, disable=False):
-    if not disable:
-        for param in model.parameters():
-            record_original_requires_grad(param)
-            param.requires_grad = False
+    if disable:
+        yield
+        return
+
+    # traverse the module tree only once
+    params = list(model.parameters())
+    for param in params:
+        record_original_requires_grad(param)
+        param.requires_grad = False
 
     yield
-    if not disable:
-        for param in model.parameters():
-            restore_original_requires_grad(param)
+    for param in params:
+        restore_original_requires_grad(param)
 
 
 def im2col_2d(x: torch.Tensor, conv2d: nn.Module):
@@ -54,11 +58,15 @@ def im2col_2d(x: torch.Tensor, conv2d: nn.Module):
     if not isinstance(conv2d, (nn.Conv2d, nn.ConvTranspose2d)):
         raise TypeError(f'conv2d has to be {nn.Conv2d} or {nn.ConvTranspose2d}. Got {type(conv2d)}.')
     if conv2d.dilation != (1, 1):
-        raise ValueError(f'conv2d.dilation has to be (1, 1). Got {conv2d.dilation}.')
+        # Tensor.unfold cannot express dilation; fall back to F.unfold
+        return im2col_2d_slow(x, conv2d)
 
     ph, pw = conv2d.padding if conv2d.padding != 'valid' else (0, 0)
     kh, kw = conv2d.kernel_size
     sy, sx = conv2d.stride
+    if (kh, kw, sy, sx, ph, pw) == (1, 1, 1, 1, 0, 0):
+        # 1x1 conv: im2col is a reshape of the input
+        return x.flatten(start_dim=2)  # n x c x (h_in)(w_in)
     if ph + pw > 0:
         x = F.pad(x, (pw, pw, ph, ph)).data
     x = x.unfold(2, kh, sy)  # n x c x h_out x w_in x kh
@@ -104,6 +112,18 @@ def cholesky_solve(X, b, damping=1e-7):
     return torch.cholesky_solve(b, u)
 
 
+def kron_eig_inverse(A, B, damping=1e-7):
+    # (A + sqrt(damping)I)^-1 (x) (B + sqrt(damping)I)^-1
+    # = (U_A diag(inv_A) U_A^T) (x) (U_B diag(inv_B) U_B^T)
+    # so the damped inverse applied to V (B_dim x A_dim) is
+    # U_B (outer(inv_B, inv_A) * (U_B^T V U_A)) U_A^T
+    # without ever forming or inverting the Kronecker product.
+    r = damping ** 0.5
+    eig_A, U_A = torch.linalg.eigh(A)
+    eig_B, U_B = torch.linalg.eigh(B)
+    return U_A, 1 / (eig_A + r), U_B, 1 / (eig_B + r)
+
+
 def smw_inv(x, damping=1e-7):
     n, d = x.shape  # n x d
     I = torch.eye(d, device=x.device)
@@ -10,7 +10,7 @@ from asdl import FisherConfig, get_fisher_maker
 from asdl import FISHER_EXACT, FISHER_MC, FISHER_EMP
 from asdl import SHAPE_FULL, SHAPE_LAYER_WISE, SHAPE_KRON, SHAPE_SWIFT_KRON, SHAPE_UNIT_WISE, SHAPE_DIAG
 from asdl import LOSS_CROSS_ENTROPY, LOSS_MSE
-from asdl import ParamVector
+from asdl import ParamVector, Scale
 
 
 _target_modules = (nn.Linear, nn.Conv2d)
@@ -386,3 +386,24 @@ class TestFisherMaker:
 
         if fisher_shape == SHAPE_FULL:
             compare_eig(model.fisher.data)
+
+
+def test_kron_exact_fisher_with_scale():
+    torch.random.manual_seed(0)
+    n_classes = 3
+    model = nn.Sequential(nn.Linear(5, 4), Scale(), nn.ReLU(), nn.Linear(4, n_classes))
+    x = torch.randn(4, 5)
+    t = torch.randint(n_classes, (4,))
+    fisher_maker = init_fisher_maker(FISHER_EXACT, SHAPE_KRON, LOSS_CROSS_ENTROPY, model, F.cross_entropy, (x, t))
+    # exact Fisher runs one backward per class after a single forward
+    fisher_maker.forward_and_backward()
+
+    scale = model[1]
+    fisher = torch.zeros(1, 1)
+    for i in range(x.shape[0]):
+        log_probs = F.log_softmax(model(x[i:i+1]), dim=1)[0]
+        probs = log_probs.exp().detach()
+        for c in range(n_classes):
+            g, = torch.autograd.grad(log_probs[c], scale.weight, retain_graph=True)
+            fisher += probs[c] * g.square()
+    torch.testing.assert_close(scale.fisher.kron.A * scale.fisher.kron.B, fisher)
@@ -0,0 +1,61 @@
+import pytest
+
+import torch
+import torch.nn as nn
+from torch.utils.data import TensorDataset, DataLoader
+from asdl import PseudoBatchLoaderGenerator, im2col_2d, im2col_2d_slow, kron_eig_inverse
+
+
+@pytest.mark.parametrize('shuffle', [False, True])
+@pytest.mark.parametrize('drop_last', [False, True])
+def test_pseudo_batch_loader_generator(shuffle, drop_last):
+    dataset_size = 10
+    pseudo_batch_size = 4
+    dataset = TensorDataset(torch.arange(dataset_size))
+    data_loader = DataLoader(dataset, batch_size=2, shuffle=shuffle, drop_last=drop_last)
+    pb_loader_generator = PseudoBatchLoaderGenerator(data_loader, pseudo_batch_size)
+
+    sizes = [4, 4] if drop_last else [4, 4, 2]
+    assert len(pb_loader_generator) == len(sizes)
+
+    seen = []
+    for pb_loader, size in zip(pb_loader_generator, sizes):
+        assert len(pb_loader.dataset) == size
+        samples = torch.cat([x for x, in pb_loader]).tolist()
+        assert samples == [pb_loader.dataset[i][0].item() for i in range(size)]
+        seen.extend(samples)
+
+    assert len(seen) == sum(sizes)
+    assert len(set(seen)) == len(seen)
+    if not drop_last:
+        assert sorted(seen) == list(range(dataset_size))
+    if not shuffle:
+        assert seen == list(range(sum(sizes)))
+
+
+@pytest.mark.parametrize('kernel_size', [1, 3, (3, 2)])
+@pytest.mark.parametrize('stride', [1, 2])
+@pytest.mark.parametrize('padding', [0, 1, (2, 1), 'valid'])
+@pytest.mark.parametrize('dilation', [1, 2, (2, 1)])
+def test_im2col_2d(kernel_size, stride, padding, dilation):
+    torch.random.manual_seed(0)
+    conv2d = nn.Conv2d(3, 4, kernel_size, stride=stride, padding=padding, dilation=dilation)
+    x = torch.randn(2, 3, 9, 8)
+    torch.testing.assert_close(im2col_2d(x, conv2d), im2col_2d_slow(x, conv2d))
+
+
+def test_kron_eig_inverse():
+    torch.random.manual_seed(0)
+    A_dim, B_dim, damping = 5, 3, 1e-2
+    a = torch.randn(A_dim, 8, dtype=torch.float64)
+    b = torch.randn(B_dim, 8, dtype=torch.float64)
+    A, B = a @ a.T, b @ b.T
+    V = torch.randn(B_dim, A_dim, dtype=torch.float64)
+
+    U_A, inv_A, U_B, inv_B = kron_eig_inverse(A, B, damping)
+    rst = U_B @ (torch.outer(inv_B, inv_A) * (U_B.T @ V @ U_A)) @ U_A.T
+
+    r = damping ** 0.5
+    A_inv = torch.linalg.inv(A + r * torch.eye(A_dim, dtype=A.dtype))
+    B_inv = torch.linalg.inv(B + r * torch.eye(B_dim, dtype=B.dtype))
+    torch.testing.assert_close(rst, B_inv @ V @ A_inv)